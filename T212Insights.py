@@ -16,20 +16,46 @@ requirements:
 import os
 import logging
 from pydantic import BaseModel, Field
-import httpx
-from typing import Union, Dict, Union, Any, List, Callable, Awaitable
+from typing import Union, Dict, Union, Any, List, Callable, Awaitable, Literal
 from datetime import datetime
-import diskcache
-from cachetools.keys import hashkey
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("trading212.log"), logging.StreamHandler()],
-)
+
+# asyncio, httpx, diskcache and cachetools are imported on first use so that loading
+# (and reloading) the tool stays cheap when it is never called.
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 logger = logging.getLogger("Trading212Tool")
 
-api_cache = diskcache.Cache("./api_cache")
+
+def configure_logging(log_file: str, log_level: str):
+    """Attaches the tool's own handlers to `logger`, replacing earlier ones.
+
+    Records still propagate to the host's handlers; a console handler is only
+    added when the root logger has none, to avoid printing every line twice.
+    If the log file cannot be opened, logging falls back to the console.
+    """
+    for handler in [h for h in logger.handlers if getattr(h, "_t212", False)]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    if not logging.getLogger().handlers:
+        handlers.append(logging.StreamHandler())
+    file_error = None
+    if log_file:
+        try:
+            handlers.append(logging.FileHandler(log_file))
+        except OSError as e:
+            file_error = e
+    for handler in handlers:
+        handler._t212 = True
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    logger.setLevel(log_level)
+    if file_error:
+        logger.warning(f"Cannot open log file {log_file}: {str(file_error)}")
 
 
 def format_order_info(json_data):
@@ -308,21 +334,153 @@ class Tools:
             description="Use demo trading environment",
         )
 
+        cache_dir: str = Field(
+            default_factory=lambda: os.getenv("TRADING212_CACHE_DIR", "./api_cache"),
+            description="Directory of the on-disk API response cache",
+        )
+
+        cache_size_limit: int = Field(
+            default=64 * 1024 * 1024,
+            description="Maximum size of the API response cache in bytes",
+        )
+
+        cache_eviction_policy: Literal[
+            "least-recently-stored",
+            "least-recently-used",
+            "least-frequently-used",
+            "none",
+        ] = Field(
+            default="least-recently-stored",
+            description="Cache eviction policy: least-recently-stored, "
+            "least-recently-used, least-frequently-used or none",
+        )
+
+        cache_ttl: int = Field(
+            default=300,
+            description="Seconds an API response is served from the cache",
+        )
+
+        request_timeout: float = Field(
+            default=30,
+            description="Timeout in seconds for Trading212 API requests",
+        )
+
+        log_file: str = Field(
+            default_factory=lambda: os.getenv("TRADING212_LOG_FILE", "trading212.log"),
+            description="Log file path (empty to log to the console only)",
+        )
+
+        log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+            default="INFO",
+            description="Logging level of the tool",
+        )
+
     def __init__(self):
         try:
             self.valves = self.Valves()
-            self.base_url = (
-                "https://demo.trading212.com"
-                if self.valves.demo_mode
-                else "https://live.trading212.com"
-            )
-            self.headers = {"Authorization": self.valves.api_key}
             self.citation = False
-            logger.info("Tool initialized successfully")
+            self._cache = None
+            self._cache_settings = None
+            self._client = None
+            self._client_settings = None
+            self._client_users = {}
+            self._log_settings = None
         except Exception as e:
             logger.error(f"Tool initialization failed: {str(e)}")
             raise
 
+    @property
+    def base_url(self) -> str:
+        return (
+            "https://demo.trading212.com"
+            if self.valves.demo_mode
+            else "https://live.trading212.com"
+        )
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": self.valves.api_key}
+
+    def _setup_logging(self):
+        """Applies the logging valves, once per distinct configuration."""
+        settings = (self.valves.log_file, self.valves.log_level)
+        if settings != self._log_settings:
+            configure_logging(*settings)
+            self._log_settings = settings
+
+    def _get_cache(self):
+        """Opens the disk cache on first use, or reopens it if its valves changed."""
+        settings = (
+            self.valves.cache_dir,
+            self.valves.cache_size_limit,
+            self.valves.cache_eviction_policy,
+        )
+        if self._cache is None or settings != self._cache_settings:
+            import diskcache
+
+            if self._cache is not None:
+                self._cache.close()
+            cache_dir, size_limit, eviction_policy = settings
+            self._cache = diskcache.Cache(
+                cache_dir, size_limit=size_limit, eviction_policy=eviction_policy
+            )
+            self._cache_settings = settings
+        return self._cache
+
+    async def _acquire_client(self):
+        """Returns the pooled HTTP client and marks it as in use.
+
+        The client lives until `aclose` is called. When the event loop or the
+        `request_timeout` valve changes, a new client is swapped in and the
+        previous one is closed once its in-flight requests have finished.
+        """
+        import asyncio
+        import httpx
+
+        settings = (asyncio.get_running_loop(), self.valves.request_timeout)
+        if (
+            self._client is None
+            or self._client.is_closed
+            or settings != self._client_settings
+        ):
+            previous = self._client
+            self._client = httpx.AsyncClient(timeout=self.valves.request_timeout)
+            self._client_settings = settings
+            if previous is not None and not self._client_users.get(previous):
+                await self._close_client(previous)
+        client = self._client
+        self._client_users[client] = self._client_users.get(client, 0) + 1
+        return client
+
+    async def _release_client(self, client):
+        users = self._client_users.pop(client) - 1
+        if users:
+            self._client_users[client] = users
+        elif client is not self._client:
+            await self._close_client(client)
+
+    async def _close_client(self, client):
+        try:
+            await client.aclose()
+        except Exception as e:
+            # The loop the client was created on may already be gone.
+            logger.warning(f"Failed to close HTTP client: {str(e)}")
+
+    async def aclose(self):
+        """Closes the pooled HTTP client and the disk cache.
+
+        Requests still in flight finish before their client is closed.
+        """
+        client = self._client
+        self._client = None
+        self._client_settings = None
+        if client is not None and not self._client_users.get(client):
+            await self._close_client(client)
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+            self._cache_settings = None
+
     async def _make_request(
         self,
         method: str,
@@ -332,15 +490,26 @@ class Tools:
         force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """Generic request handler with full type annotations"""
+        import hashlib
+        import httpx
+        from cachetools.keys import hashkey
+
         # Normalize `params` to avoid cache misses due to empty vs. None
         params_tuple = tuple(sorted(params.items())) if params else ()
-        cache_key = hashkey(method, endpoint, params_tuple)
+        # Scope entries to the environment and account so that switching
+        # demo_mode or api_key never serves another account's data
+        account = hashlib.sha256(self.valves.api_key.encode()).hexdigest()
+        cache_key = hashkey(self.base_url, account, method, endpoint, params_tuple)
 
-        if not force_refresh and cache_key in api_cache:
-            logger.info(f"Cache hit for {endpoint} with params {params}")
-            return api_cache[cache_key]
+        try:
+            self._setup_logging()
+            api_cache = self._get_cache()
 
-        async with httpx.AsyncClient(timeout=30) as client:
+            if not force_refresh and cache_key in api_cache:
+                logger.info(f"Cache hit for {endpoint} with params {params}")
+                return api_cache[cache_key]
+
+            client = await self._acquire_client()
             try:
                 response = await client.request(
                     method,
@@ -349,23 +518,24 @@ class Tools:
                     params=params,
                     json=data,
                 )
-                response.raise_for_status()
-                # Store in cache under lock
-                api_cache.set(
-                    cache_key, response.json(), expire=300
-                )  # Store with TTL 5 min
-                logger.info(
-                    f"Stored in cache: {cache_key} | Cache size: {len(api_cache)}"
-                )
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                return {
-                    "error": f"API Error {e.response.status_code}",
-                    "details": e.response.text,
-                    "endpoint": endpoint,
-                }
-            except Exception as e:
-                return {"error": str(e)}
+            finally:
+                await self._release_client(client)
+            response.raise_for_status()
+            result = response.json()
+            api_cache.set(cache_key, result, expire=self.valves.cache_ttl)
+            logger.info(
+                f"Stored in cache: {endpoint} with params {params} "
+                f"| Cache size: {len(api_cache)}"
+            )
+            return result
+        except httpx.HTTPStatusError as e:
+            return {
+                "error": f"API Error {e.response.status_code}",
+                "details": e.response.text,
+                "endpoint": endpoint,
+            }
+        except Exception as e:
+            return {"error": str(e)}
 
     async def get_account_cash(
         self, __event_emitter__: Union[Callable[[Any], Awaitable[None]]] = None
@@ -0,0 +1,114 @@
+"""
+Checks that importing T212Insights stays cheap.
+
+Imports the tool in a fresh interpreter from an empty working directory and
+fails if the import exceeds the time budget, loads one of the lazily imported
+modules, or creates the API cache or log file. A second interpreter then times
+the first and the cached `_make_request` call against `httpx.MockTransport`.
+
+Usage: python scripts/check_import.py [--budget SECONDS]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ["httpx", "diskcache", "cachetools", "asyncio"]
+LAZY_FILES = ["api_cache", "trading212.log"]
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import T212Insights
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+CALL_PROBE = """
+import asyncio, json, sys, time
+sys.path.insert(0, sys.argv[1])
+import T212Insights
+
+async def main():
+    import httpx
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    client_class = httpx.AsyncClient
+    httpx.AsyncClient = lambda **kwargs: client_class(transport=transport, **kwargs)
+
+    tool = T212Insights.Tools()
+    timings = {}
+    for name in ["first", "cached"]:
+        start = time.perf_counter()
+        result = await tool._make_request("GET", "/api/v0/equity/account/info")
+        timings[name] = time.perf_counter() - start
+        if "error" in result:
+            raise SystemExit(f"{name} call failed: {result}")
+    await tool.aclose()
+    print(json.dumps(timings))
+
+asyncio.run(main())
+"""
+
+
+def run_probe(probe, cwd):
+    """Runs `probe` in a fresh interpreter and returns its JSON output."""
+    process = subprocess.run(
+        [sys.executable, "-c", probe, ROOT],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode:
+        sys.stderr.write(process.stderr)
+        sys.exit(process.returncode)
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.5,
+        help="Maximum import time in seconds (default: 0.5)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        result = run_probe(IMPORT_PROBE, cwd)
+        created = [
+            name for name in LAZY_FILES if os.path.exists(os.path.join(cwd, name))
+        ]
+    with tempfile.TemporaryDirectory() as cwd:
+        timings = run_probe(CALL_PROBE, cwd)
+
+    loaded = [name for name in LAZY_MODULES if name in result["modules"]]
+
+    print(
+        f"Import time: {result['elapsed'] * 1000:.1f} ms "
+        f"(budget {args.budget * 1000:.0f} ms)"
+    )
+    print(f"First call: {timings['first'] * 1000:.1f} ms")
+    print(f"Cached call: {timings['cached'] * 1000:.1f} ms")
+    errors = []
+    if result["elapsed"] > args.budget:
+        errors.append("import exceeded the time budget")
+    if loaded:
+        errors.append(f"modules loaded on import: {', '.join(loaded)}")
+    if created:
+        errors.append(f"files created on import: {', '.join(created)}")
+
+    for error in errors:
+        print(f"FAIL: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())